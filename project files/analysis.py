@@ -10,6 +10,10 @@ def analyze_results(results_df, output_dir="results/analysis"):
 
     df = results_df.copy()
 
+    if 'ilp_valid' not in df.columns or 'sa_valid' not in df.columns:
+        print("Results do not contain both ILP and SA runs. Cannot perform comparative analysis.")
+        return
+
     valid_results = df[(df['ilp_valid'] == True) & (df['sa_valid'] == True)].copy()
 
     if valid_results.empty:
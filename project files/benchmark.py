@@ -1,37 +1,102 @@
-from ilp_solver import DominatingSetILP
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
 from sa_solver import DominatingSetSA
-from visualizations import visualize_graph_with_solution
 
 
-def run_benchmark(instances, ilp_time_limit=300, sa_time_limit=300, sa_iterations=100):
-    results = []
+def run_benchmark(instances, ilp_time_limit=300, sa_time_limit=300, sa_iterations=100, solvers=("ilp", "sa"),
+                  plot=True, workers=1, results_dir="results"):
+    options = {
+        'ilp_time_limit': ilp_time_limit,
+        'sa_time_limit': sa_time_limit,
+        'sa_iterations': sa_iterations,
+        'solvers': tuple(solvers),
+        'plot': plot,
+        'results_dir': results_dir
+    }
+
+    if workers > 1 and len(instances) > 1:
+        if plot:
+            # The plots draw with networkx, so each task gets its own copy of the graph.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(benchmark_instance, instances, [options] * len(instances)))
+
+        from shared_graph import SharedGraph
+
+        with ExitStack() as stack, ProcessPoolExecutor(max_workers=workers) as executor:
+            handles = [stack.enter_context(SharedGraph(instance_data[0])).handle for instance_data in instances]
+            details = [instance_data[1:] for instance_data in instances]
+            return list(executor.map(_benchmark_shared_instance, handles, details, [options] * len(instances)))
+
+    return [benchmark_instance(instance_data, options) for instance_data in instances]
+
+
+def _benchmark_shared_instance(handle, details, options):
+    return benchmark_instance((handle.open(), *details), options)
+
 
-    for instance_data in instances:
-        graph, name = instance_data[0], instance_data[1]
-        known_solution = instance_data[2] if len(instance_data) > 2 else None
+def benchmark_instance(instance_data, options):
+    ilp_time_limit = options['ilp_time_limit']
+    sa_time_limit = options['sa_time_limit']
+    sa_iterations = options['sa_iterations']
+    run_ilp = 'ilp' in options['solvers']
+    run_sa = 'sa' in options['solvers']
+    plot = options['plot']
+    results_dir = options['results_dir']
 
-        print(f"\nSolving instance: {name}")
-        print(f"Graph size: {len(graph.nodes())} nodes, {len(graph.edges())} edges")
+    if run_ilp:
+        from ilp_solver import DominatingSetILP
+    if plot:
+        from visualizations import visualize_graph_with_solution
 
-        if known_solution:
-            known_solution_size = len(known_solution)
-            print(f"Known solution size: {known_solution_size}")
+    graph, name = instance_data[0], instance_data[1]
+    known_solution = instance_data[2] if len(instance_data) > 2 else None
 
-            ds_checker = DominatingSetSA(graph)
-            is_valid_solution = ds_checker.is_dominating_set(known_solution)
-            print(f"Known solution is valid: {is_valid_solution}")
-        else:
-            known_solution_size = None
-            is_valid_solution = None
+    print(f"\nSolving instance: {name}")
+    print(f"Graph size: {len(graph.nodes())} nodes, {graph.number_of_edges()} edges")
 
+    if known_solution:
+        known_solution_size = len(known_solution)
+        print(f"Known solution size: {known_solution_size}")
+
+        ds_checker = DominatingSetSA(graph)
+        is_valid_solution = ds_checker.is_dominating_set(known_solution)
+        print(f"Known solution is valid: {is_valid_solution}")
+    else:
+        known_solution_size = None
+        is_valid_solution = None
+
+    result_dict = {
+        'instance': name,
+        'nodes': len(graph.nodes()),
+        'edges': graph.number_of_edges()
+    }
+
+    if run_ilp:
         print("Solving with ILP...")
         ilp_solver = DominatingSetILP(graph)
         ilp_solution = ilp_solver.solve(time_limit=ilp_time_limit)
-        ilp_obj_value = ilp_solver.objective_value
         ilp_runtime = ilp_solver.runtime
         ilp_valid = ilp_solver.objective_value < float('inf')
         ilp_optimal_found = ilp_solver.optimal_solution_found
 
+        if plot:
+            visualize_graph_with_solution(
+                graph, ilp_solution,
+                f"{name} - ILP Solution (size: {len(ilp_solution)})",
+                filename=os.path.join(results_dir, f"{name}_ilp.png"),
+                optimal_solution_found=ilp_optimal_found
+            )
+
+        result_dict.update({
+            'ilp_solution_size': len(ilp_solution) if ilp_valid else None,
+            'ilp_runtime': ilp_runtime,
+            'ilp_valid': ilp_valid,
+            'ilp_optimal_found': ilp_optimal_found
+        })
+
+    if run_sa:
         print("Solving with SA...")
         sa_solver = DominatingSetSA(graph)
         sa_solution = sa_solver.solve(
@@ -41,78 +106,64 @@ def run_benchmark(instances, ilp_time_limit=300, sa_time_limit=300, sa_iteration
             iterations_per_temp=sa_iterations,
             time_limit=sa_time_limit
         )
-        sa_obj_value = sa_solver.best_objective_value
         sa_runtime = sa_solver.runtime
         sa_valid = sa_solver.is_dominating_set(sa_solution)
         sa_optimal_found = sa_solver.optimal_solution_found
 
-        visualize_graph_with_solution(
-            graph, ilp_solution,
-            f"{name} - ILP Solution (size: {len(ilp_solution)})",
-            filename=f"results/{name}_ilp.png",
-            optimal_solution_found=ilp_optimal_found
-        )
-
-        visualize_graph_with_solution(
-            graph, sa_solution,
-            f"{name} - SA Solution (size: {len(sa_solution)})",
-            filename=f"results/{name}_sa.png",
-            optimal_solution_found=sa_optimal_found
-        )
-
-        if known_solution and is_valid_solution:
+        if plot:
             visualize_graph_with_solution(
-                graph, known_solution,
-                f"{name} - Known Solution (size: {known_solution_size})",
-                filename=f"results/{name}_known.png",
-                optimal_solution_found=True
+                graph, sa_solution,
+                f"{name} - SA Solution (size: {len(sa_solution)})",
+                filename=os.path.join(results_dir, f"{name}_sa.png"),
+                optimal_solution_found=sa_optimal_found
             )
 
-        result_dict = {
-            'instance': name,
-            'nodes': len(graph.nodes()),
-            'edges': len(graph.edges()),
-            'ilp_solution_size': len(ilp_solution) if ilp_valid else None,
-            'ilp_runtime': ilp_runtime,
-            'ilp_valid': ilp_valid,
-            'ilp_optimal_found': ilp_optimal_found,
+        result_dict.update({
             'sa_solution_size': len(sa_solution) if sa_valid else None,
             'sa_runtime': sa_runtime,
             'sa_valid': sa_valid,
             'sa_optimal_found': sa_optimal_found
-        }
+        })
 
-        if known_solution_size is not None:
-            result_dict['known_solution_size'] = known_solution_size
-            result_dict['known_solution_valid'] = is_valid_solution
+    if plot and known_solution and is_valid_solution:
+        visualize_graph_with_solution(
+            graph, known_solution,
+            f"{name} - Known Solution (size: {known_solution_size})",
+            filename=os.path.join(results_dir, f"{name}_known.png"),
+            optimal_solution_found=True
+        )
 
-            if ilp_valid:
-                result_dict['ilp_gap'] = ((
-                                              abs(len(
-                                                  ilp_solution) - known_solution_size)) / known_solution_size * 100) if known_solution_size > 0 else None
+    if known_solution_size is not None:
+        result_dict['known_solution_size'] = known_solution_size
+        result_dict['known_solution_valid'] = is_valid_solution
 
-            if sa_valid:
-                result_dict['sa_gap'] = ((
-                                             abs(len(
-                                                 sa_solution) - known_solution_size)) / known_solution_size * 100) if known_solution_size > 0 else None
+        if run_ilp and ilp_valid:
+            result_dict['ilp_gap'] = ((
+                                          abs(len(
+                                              ilp_solution) - known_solution_size)) / known_solution_size * 100) if known_solution_size > 0 else None
 
-        if ilp_valid and sa_valid:
-            result_dict['ilp_sa_gap'] = ((len(sa_solution) - len(ilp_solution)) / len(ilp_solution) * 100) if len(
-                ilp_solution) > 0 else None
+        if run_sa and sa_valid:
+            result_dict['sa_gap'] = ((
+                                         abs(len(
+                                             sa_solution) - known_solution_size)) / known_solution_size * 100) if known_solution_size > 0 else None
 
-        results.append(result_dict)
+    if run_ilp and run_sa and ilp_valid and sa_valid:
+        result_dict['ilp_sa_gap'] = ((len(sa_solution) - len(ilp_solution)) / len(ilp_solution) * 100) if len(
+            ilp_solution) > 0 else None
 
+    if run_ilp:
         print(
             f"ILP: {'Valid' if ilp_valid else 'Invalid'}, Size: {len(ilp_solution) if ilp_valid else 'N/A'}, Time: {ilp_runtime:.2f}s")
         if not ilp_optimal_found:
             print("WARNING: ILP could not find an optimal solution - using all nodes as fallback")
 
+    if run_sa:
         print(
             f"SA: {'Valid' if sa_valid else 'Invalid'}, Size: {len(sa_solution) if sa_valid else 'N/A'}, Time: {sa_runtime:.2f}s")
         if not sa_optimal_found:
             print("WARNING: SA could not find an optimal solution - using all nodes as fallback")
 
-        if known_solution_size is not None:
-            print(f"Known: {'Valid' if is_valid_solution else 'Invalid'}, Size: {known_solution_size}")
+    if known_solution_size is not None:
+        print(f"Known: {'Valid' if is_valid_solution else 'Invalid'}, Size: {known_solution_size}")
 
-    return results
\ No newline at end of file
+    return result_dict
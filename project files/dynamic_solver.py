@@ -0,0 +1,196 @@
+import math
+import random
+import time
+
+
+class DynamicDominatingSet:
+    def __init__(self, graph, solution=None, polish_iterations=0, polish_temp=1.0, cooling_rate=0.95):
+        self.graph = graph
+        self.polish_iterations = polish_iterations
+        self.polish_temp = polish_temp
+        self.cooling_rate = cooling_rate
+        self.solution = set()
+        # number of solution nodes in the closed neighbourhood of each node
+        self.cover = {node: 0 for node in graph.nodes()}
+        self.runtime = None
+
+        start_time = time.time()
+        for node in solution or []:
+            if node in self.graph and node not in self.solution:
+                self._add_to_solution(node)
+        self._repair(list(self.graph.nodes()))
+        self.runtime = time.time() - start_time
+
+    def is_dominating_set(self):
+        return all(count > 0 for count in self.cover.values())
+
+    def get_solution(self):
+        return sorted(self.solution)
+
+    def add_edge(self, u, v):
+        return self.apply_updates([('add_edge', u, v)])
+
+    def remove_edge(self, u, v):
+        return self.apply_updates([('remove_edge', u, v)])
+
+    def add_node(self, node, neighbors=()):
+        return self.apply_updates([('add_node', node, list(neighbors))])
+
+    def remove_node(self, node):
+        return self.apply_updates([('remove_node', node)])
+
+    def apply_updates(self, updates):
+        if not hasattr(self.graph, 'add_edge'):
+            raise TypeError(f"{type(self.graph).__name__} is read-only; load the graph with networkx to apply updates")
+
+        start_time = time.time()
+        touched = set()
+
+        try:
+            for update in updates:
+                operation, args = update[0], update[1:]
+                if operation == 'add_edge':
+                    self._apply_add_edge(touched, *args)
+                elif operation == 'remove_edge':
+                    self._apply_remove_edge(touched, *args)
+                elif operation == 'add_node':
+                    self._apply_add_node(touched, *args)
+                elif operation == 'remove_node':
+                    self._apply_remove_node(touched, *args)
+                else:
+                    raise ValueError(f"Unknown graph update: {operation}")
+        finally:
+            # Updates before a failing one stay applied, so repair around them
+            # before the error propagates.
+            self._repair([node for node in touched if node in self.graph])
+            self.runtime = time.time() - start_time
+
+        return self.get_solution()
+
+    def _apply_add_edge(self, touched, u, v):
+        for node in (u, v):
+            if node not in self.graph:
+                self.graph.add_node(node)
+                self.cover[node] = 0
+            touched.add(node)
+
+        if u == v or self.graph.has_edge(u, v):
+            return
+
+        self.graph.add_edge(u, v)
+        if u in self.solution:
+            self.cover[v] += 1
+        if v in self.solution:
+            self.cover[u] += 1
+
+    def _apply_remove_edge(self, touched, u, v):
+        self.graph.remove_edge(u, v)
+        touched.update((u, v))
+        if u in self.solution:
+            self.cover[v] -= 1
+        if v in self.solution:
+            self.cover[u] -= 1
+
+    def _apply_add_node(self, touched, node, neighbors=()):
+        if node not in self.graph:
+            self.graph.add_node(node)
+            self.cover[node] = 0
+        touched.add(node)
+
+        for neighbor in neighbors:
+            self._apply_add_edge(touched, node, neighbor)
+
+    def _apply_remove_node(self, touched, node):
+        neighbors = list(self.graph.neighbors(node))
+        if node in self.solution:
+            self._remove_from_solution(node)
+
+        self.graph.remove_node(node)
+        del self.cover[node]
+        touched.update(neighbors)
+
+    def _closed_neighborhood(self, node):
+        return [node, *self.graph.neighbors(node)]
+
+    def _add_to_solution(self, node):
+        self.solution.add(node)
+        for w in self._closed_neighborhood(node):
+            self.cover[w] += 1
+
+    def _remove_from_solution(self, node):
+        self.solution.remove(node)
+        for w in self._closed_neighborhood(node):
+            self.cover[w] -= 1
+
+    def _region(self, nodes, radius=2):
+        region = set(nodes)
+        frontier = set(nodes)
+        for _ in range(radius):
+            frontier = {w for node in frontier for w in self.graph.neighbors(node)} - region
+            region.update(frontier)
+        return region
+
+    def _dominate(self, nodes, exclude=None):
+        added = []
+        for node in nodes:
+            if self.cover[node] > 0:
+                continue
+
+            candidates = [c for c in self._closed_neighborhood(node) if c != exclude]
+            if not candidates:
+                candidates = [node]
+
+            best = max(candidates,
+                       key=lambda c: sum(1 for w in self._closed_neighborhood(c) if self.cover[w] == 0))
+            self._add_to_solution(best)
+            added.append(best)
+        return added
+
+    def _is_redundant(self, node):
+        return all(self.cover[w] > 1 for w in self._closed_neighborhood(node))
+
+    def _prune(self, region):
+        candidates = [node for node in region if node in self.solution]
+        for node in sorted(candidates, key=lambda n: self.graph.degree(n)):
+            if self._is_redundant(node):
+                self._remove_from_solution(node)
+
+    def _repair(self, touched):
+        added = self._dominate(touched)
+        region = self._region(set(touched) | set(added))
+        self._prune(region)
+
+        if self.polish_iterations > 0:
+            self._polish(region)
+
+    def _polish(self, region):
+        best_solution = set(self.solution)
+        temperature = self.polish_temp
+
+        for _ in range(self.polish_iterations):
+            candidates = [node for node in region if node in self.solution]
+            if not candidates:
+                break
+
+            removed = random.choice(candidates)
+            self._remove_from_solution(removed)
+            undominated = [w for w in self._closed_neighborhood(removed) if self.cover[w] == 0]
+            added = self._dominate(undominated, exclude=removed)
+
+            delta = len(added) - 1
+            if delta <= 0 or random.random() < math.exp(-delta / temperature):
+                self._prune(self._region(added))
+                if len(self.solution) < len(best_solution):
+                    best_solution = set(self.solution)
+            else:
+                for node in added:
+                    self._remove_from_solution(node)
+                self._add_to_solution(removed)
+
+            temperature *= self.cooling_rate
+
+        if len(self.solution) > len(best_solution):
+            for node in list(self.solution - best_solution):
+                self._remove_from_solution(node)
+            for node in list(best_solution - self.solution):
+                self._add_to_solution(node)
@@ -0,0 +1,259 @@
+import math
+import time
+
+EXACT_MAX_NODES = 48
+EXACT_MAX_BRANCHES = 2000
+
+
+def connected_components(graph):
+    seen = set()
+    components = []
+
+    for start in graph.nodes():
+        if start in seen:
+            continue
+
+        seen.add(start)
+        component = [start]
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in graph.neighbors(node):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    component.append(neighbor)
+                    stack.append(neighbor)
+        components.append(component)
+
+    return components
+
+
+def _bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _greedy(closed, solution=()):
+    # Extends solution greedily until it dominates every vertex, then drops
+    # nodes that became redundant.
+    solution = list(solution)
+    undominated = (1 << len(closed)) - 1
+    for c in solution:
+        undominated &= ~closed[c]
+
+    while undominated:
+        best = max(range(len(closed)), key=lambda c: (closed[c] & undominated).bit_count())
+        solution.append(best)
+        undominated &= ~closed[best]
+
+    cover = [0] * len(closed)
+    for c in solution:
+        for v in _bits(closed[c]):
+            cover[v] += 1
+    for c in sorted(solution, key=lambda c: closed[c].bit_count()):
+        if all(cover[v] > 1 for v in _bits(closed[c])):
+            solution.remove(c)
+            for v in _bits(closed[c]):
+                cover[v] -= 1
+
+    return solution
+
+
+def _lower_bound(closed, undominated, available):
+    # Every chosen node dominates at most its best coverage, so charging each
+    # undominated vertex 1 / (best coverage among its candidates) never exceeds
+    # the number of nodes still needed.
+    bound = 0.0
+    for v in _bits(undominated):
+        best_cover = max((closed[c] & undominated).bit_count() for c in _bits(closed[v] & available))
+        bound += 1.0 / best_cover
+    return math.ceil(bound - 1e-9)
+
+
+def _split(closed, undominated, available):
+    # Undominated vertices that share no candidate can be dominated independently.
+    parts = []
+    remaining = undominated
+    while remaining:
+        low = remaining & -remaining
+        part = low
+        frontier = low
+        while frontier:
+            reach = 0
+            for v in _bits(frontier):
+                for c in _bits(closed[v] & available):
+                    reach |= closed[c]
+            reach &= remaining
+            frontier = reach & ~part
+            part |= reach
+        remaining &= ~part
+        parts.append(part)
+    return parts
+
+
+def _candidates_of(closed, undominated, available):
+    candidates = 0
+    for v in _bits(undominated):
+        candidates |= closed[v]
+    return candidates & available
+
+
+def branch_and_reduce(closed, deadline=None, max_branches=EXACT_MAX_BRANCHES):
+    greedy_solution = _greedy(closed)
+    # 'best' is the smallest complete solution seen so far, returned if the
+    # search is cut short.
+    state = {'branches': 0, 'aborted': False, 'best': greedy_solution}
+    # (undominated, available) -> ('exact', solution) or ('bound', lower bound)
+    memo = {}
+
+    def record(chosen, solution):
+        # chosen are the nodes picked outside the subproblem that solution
+        # solves; vertices left to other subproblems are filled in greedily.
+        if len(chosen) + len(solution) < len(state['best']):
+            complete = _greedy(closed, chosen + solution)
+            if len(complete) < len(state['best']):
+                state['best'] = complete
+
+    def search(undominated, available, limit, chosen):
+        # Smallest subset of available that dominates undominated with fewer
+        # than limit nodes, or None if there is none.
+        if state['aborted']:
+            return None
+        state['branches'] += 1
+        out_of_branches = max_branches is not None and state['branches'] > max_branches
+        if out_of_branches or (deadline is not None and time.time() > deadline):
+            state['aborted'] = True
+            return None
+        # Only solutions that can still beat the best one seen are worth finding.
+        limit = min(limit, len(state['best']) - len(chosen))
+
+        key = (undominated, available)
+        known = memo.get(key)
+        if known is not None:
+            if known[0] == 'exact':
+                return known[1] if len(known[1]) < limit else None
+            if known[1] >= limit:
+                return None
+
+        result = reduce_and_branch(undominated, available, limit, chosen)
+        if result is not None:
+            record(chosen, result)
+        if state['aborted']:
+            return None
+
+        if result is not None:
+            memo[key] = ('exact', result)
+        elif known is None or limit > known[1]:
+            memo[key] = ('bound', limit)
+        return result
+
+    def reduce_and_branch(undominated, available, limit, chosen):
+        forced = []
+        branch_vertex = None
+        while undominated:
+            forced_node = None
+            fewest = None
+            for v in _bits(undominated):
+                candidates = closed[v] & available
+                if not candidates:
+                    return None
+                count = candidates.bit_count()
+                if count == 1:
+                    forced_node = candidates.bit_length() - 1
+                    break
+                if fewest is None or count < fewest:
+                    fewest, branch_vertex = count, v
+
+            if forced_node is None:
+                break
+            forced.append(forced_node)
+            undominated &= ~closed[forced_node]
+            available &= ~(1 << forced_node)
+
+        limit -= len(forced)
+        if not undominated:
+            return forced if limit > 0 else None
+        if limit <= 1 or _lower_bound(closed, undominated, available) >= limit:
+            return None
+
+        parts = _split(closed, undominated, available)
+        if len(parts) > 1:
+            bounds = [_lower_bound(closed, part, available) for part in parts]
+            if sum(bounds) >= limit:
+                return None
+
+            solution = list(forced)
+            used = 0
+            for i, part in enumerate(parts):
+                part_limit = limit - used - sum(bounds[i + 1:])
+                part_solution = search(part, _candidates_of(closed, part, available), part_limit, chosen + solution)
+                if part_solution is None:
+                    return None
+                solution.extend(part_solution)
+                used += len(part_solution)
+            return solution
+
+        candidates = list(_bits(closed[branch_vertex] & available))
+        cover = {c: closed[c] & undominated for c in candidates}
+        # Drop candidates whose coverage is contained in another candidate's:
+        # swapping one for the other never makes a solution worse.
+        kept = [c for c in candidates
+                if not any(d != c and cover[c] & ~cover[d] == 0 and (cover[c] != cover[d] or d < c)
+                           for d in candidates)]
+
+        best = None
+        for c in sorted(kept, key=lambda c: cover[c].bit_count(), reverse=True):
+            sub_solution = search(undominated & ~closed[c], available & ~(1 << c), limit - 1, chosen + forced + [c])
+            if state['aborted']:
+                return None
+            if sub_solution is not None:
+                best = [c] + sub_solution
+                limit = len(best)
+            available &= ~(1 << c)
+
+        return forced + best if best is not None else None
+
+    full = (1 << len(closed)) - 1
+    # Every solution the search finds is recorded, so once it finishes the
+    # best one seen is optimal.
+    search(full, full, len(greedy_solution), [])
+    return state['best'], not state['aborted']
+
+
+def solve_component(graph, nodes, deadline=None, max_branches=EXACT_MAX_BRANCHES):
+    index = {node: i for i, node in enumerate(nodes)}
+    closed = []
+    for node in nodes:
+        mask = 1 << index[node]
+        for neighbor in graph.neighbors(node):
+            mask |= 1 << index[neighbor]
+        closed.append(mask)
+
+    solution, proven = branch_and_reduce(closed, deadline, max_branches)
+    return [nodes[i] for i in solution], proven
+
+
+class DominatingSetExact:
+    def __init__(self, graph):
+        self.graph = graph
+        self.solution = None
+        self.objective_value = None
+        self.runtime = None
+        self.optimal_solution_found = False
+
+    def solve(self, time_limit=300, max_branches=EXACT_MAX_BRANCHES):
+        start_time = time.time()
+        deadline = start_time + time_limit
+
+        self.solution = []
+        self.optimal_solution_found = True
+        for component in connected_components(self.graph):
+            component_solution, proven = solve_component(self.graph, component, deadline, max_branches)
+            self.solution.extend(component_solution)
+            self.optimal_solution_found = self.optimal_solution_found and proven
+
+        self.objective_value = len(self.solution)
+        self.runtime = time.time() - start_time
+        return self.solution
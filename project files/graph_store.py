@@ -0,0 +1,343 @@
+import json
+import os
+
+import numpy as np
+
+STORE_VERSION = 1
+CHUNK_SIZE = 1 << 20
+
+INDPTR_FILE = "indptr.npy"
+INDICES_FILE = "indices.npy"
+RAW_INDICES_FILE = "indices.raw.npy"
+NODE_IDS_FILE = "node_ids.npy"
+METADATA_FILE = "metadata.json"
+
+
+def _read_header(gr_path):
+    with open(gr_path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0] == 'c':
+                continue
+            if len(parts) >= 4 and parts[0] == 'p' and parts[1] == 'ds':
+                return int(parts[2]), int(parts[3])
+            break
+
+    raise ValueError(f"{gr_path} does not start with a 'p ds <nodes> <edges>' header")
+
+
+def _iter_edge_chunks(gr_path, num_nodes, chunk_size=CHUNK_SIZE):
+    sources, targets = [], []
+
+    with open(gr_path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 2 or parts[0] in ('c', 'p'):
+                continue
+
+            u, v = int(parts[0]), int(parts[1])
+            if u == v:
+                continue
+            if not (1 <= u <= num_nodes and 1 <= v <= num_nodes):
+                raise ValueError(f"Edge ({u}, {v}) in {gr_path} has an endpoint outside 1..{num_nodes}")
+
+            sources.append(u - 1)
+            targets.append(v - 1)
+            if len(sources) >= chunk_size:
+                yield np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64)
+                sources, targets = [], []
+
+    if sources:
+        yield np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64)
+
+
+def _create_array(store_dir, filename, dtype, shape):
+    return np.lib.format.open_memmap(os.path.join(store_dir, filename), mode='w+', dtype=dtype, shape=shape)
+
+
+def _index_dtype(num_nodes):
+    return np.int32 if num_nodes < np.iinfo(np.int32).max else np.int64
+
+
+def _deduplicate_rows(indptr, indices, chunk_size=CHUNK_SIZE):
+    # Drop repeated neighbours from each row, keeping the first occurrence so
+    # rows stay in file order, and compact the rows towards the start of
+    # indices. Updates indptr in place and returns the number of entries kept.
+    old_indptr = np.array(indptr)
+    num_nodes = len(old_indptr) - 1
+    written = 0
+
+    start_row = 0
+    while start_row < num_nodes:
+        end_row = int(np.searchsorted(old_indptr, old_indptr[start_row] + chunk_size, side='right')) - 1
+        end_row = min(max(end_row, start_row + 1), num_nodes)
+        lo, hi = int(old_indptr[start_row]), int(old_indptr[end_row])
+
+        rows = np.repeat(np.arange(start_row, end_row), np.diff(old_indptr[start_row:end_row + 1]))
+        values = np.array(indices[lo:hi])
+        order = np.lexsort((values, rows))
+        sorted_rows, sorted_values = rows[order], values[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (sorted_rows[1:] != sorted_rows[:-1]) | (sorted_values[1:] != sorted_values[:-1])
+        kept = np.sort(order[first])
+
+        indices[written:written + len(kept)] = values[kept]
+        counts = np.bincount(rows[kept] - start_row, minlength=end_row - start_row)
+        indptr[start_row + 1:end_row + 1] = written + np.cumsum(counts)
+        written += len(kept)
+        start_row = end_row
+
+    return written
+
+
+def _write_metadata(store_dir, num_nodes, num_edges, index_dtype, source):
+    metadata = {
+        'version': STORE_VERSION,
+        'num_nodes': num_nodes,
+        'num_edges': num_edges,
+        'index_dtype': np.dtype(index_dtype).name,
+        'source': source
+    }
+    with open(os.path.join(store_dir, METADATA_FILE), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+
+def convert_gr_to_store(gr_path, store_dir, chunk_size=CHUNK_SIZE):
+    os.makedirs(store_dir, exist_ok=True)
+    num_nodes, _ = _read_header(gr_path)
+
+    degree = np.zeros(num_nodes, dtype=np.int64)
+    for u, v in _iter_edge_chunks(gr_path, num_nodes, chunk_size):
+        np.add.at(degree, u, 1)
+        np.add.at(degree, v, 1)
+
+    indptr = _create_array(store_dir, INDPTR_FILE, np.int64, (num_nodes + 1,))
+    indptr[0] = 0
+    np.cumsum(degree, out=indptr[1:])
+    num_entries = int(indptr[-1])
+    del degree
+
+    index_dtype = _index_dtype(num_nodes)
+    raw_indices = _create_array(store_dir, RAW_INDICES_FILE, index_dtype, (num_entries,))
+
+    next_slot = np.array(indptr[:-1])
+    for u, v in _iter_edge_chunks(gr_path, num_nodes, chunk_size):
+        sources = np.concatenate([u, v])
+        targets = np.concatenate([v, u])
+        order = np.argsort(sources, kind='stable')
+        sources, targets = sources[order], targets[order]
+
+        starts = np.flatnonzero(np.r_[True, sources[1:] != sources[:-1]])
+        counts = np.diff(np.r_[starts, len(sources)])
+        rank = np.arange(len(sources)) - np.repeat(starts, counts)
+
+        raw_indices[next_slot[sources] + rank] = targets
+        next_slot[sources[starts]] += counts
+    del next_slot
+
+    # .gr files may list an edge twice (as "u v" and "v u", or verbatim), which
+    # networkx collapses into one edge.
+    raw_entries = num_entries
+    num_entries = _deduplicate_rows(indptr, raw_indices, chunk_size)
+    raw_indices.flush()
+    raw_path = os.path.join(store_dir, RAW_INDICES_FILE)
+    if num_entries == raw_entries:
+        del raw_indices
+        os.replace(raw_path, os.path.join(store_dir, INDICES_FILE))
+        indices = np.load(os.path.join(store_dir, INDICES_FILE), mmap_mode='r+')
+    else:
+        indices = _create_array(store_dir, INDICES_FILE, index_dtype, (num_entries,))
+        for start in range(0, num_entries, chunk_size):
+            end = min(start + chunk_size, num_entries)
+            indices[start:end] = raw_indices[start:end]
+        del raw_indices
+        os.remove(raw_path)
+
+    node_ids = _create_array(store_dir, NODE_IDS_FILE, np.int64, (num_nodes,))
+    node_ids[:] = np.arange(1, num_nodes + 1)
+
+    for array in (indptr, indices, node_ids):
+        array.flush()
+
+    _write_metadata(store_dir, num_nodes, num_entries // 2, index_dtype, os.path.basename(gr_path))
+    return GraphStore(store_dir)
+
+
+def write_graph_to_store(graph, store_dir, source=None):
+    os.makedirs(store_dir, exist_ok=True)
+    nodes = sorted(graph.nodes())
+    num_nodes = len(nodes)
+    node_index = {node: index for index, node in enumerate(nodes)}
+
+    rows = [[node_index[neighbor] for neighbor in graph.neighbors(node) if neighbor != node] for node in nodes]
+
+    indptr = _create_array(store_dir, INDPTR_FILE, np.int64, (num_nodes + 1,))
+    indptr[0] = 0
+    np.cumsum([len(row) for row in rows], out=indptr[1:])
+    num_entries = int(indptr[-1])
+
+    index_dtype = _index_dtype(num_nodes)
+    indices = _create_array(store_dir, INDICES_FILE, index_dtype, (num_entries,))
+    for index, row in enumerate(rows):
+        indices[indptr[index]:indptr[index + 1]] = row
+
+    node_ids = _create_array(store_dir, NODE_IDS_FILE, np.int64, (num_nodes,))
+    node_ids[:] = nodes
+
+    for array in (indptr, indices, node_ids):
+        array.flush()
+
+    _write_metadata(store_dir, num_nodes, num_entries // 2, index_dtype, source)
+    return GraphStore(store_dir)
+
+
+class GraphStore:
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+
+        with open(os.path.join(store_dir, METADATA_FILE), 'r') as f:
+            self.metadata = json.load(f)
+        if self.metadata.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported graph store version in {store_dir}: {self.metadata.get('version')}")
+
+        self.indptr = np.load(os.path.join(store_dir, INDPTR_FILE), mmap_mode='r')
+        self.indices = np.load(os.path.join(store_dir, INDICES_FILE), mmap_mode='r')
+        self.node_ids = np.load(os.path.join(store_dir, NODE_IDS_FILE), mmap_mode='r')
+
+        # memoryviews of the same mappings: still zero-copy, but indexing and
+        # tolist() return plain ints without per-call numpy overhead, which
+        # matters because the solvers look up one node at a time.
+        self._indptr = memoryview(np.asarray(self.indptr))
+        self._indices = memoryview(np.asarray(self.indices))
+
+        # Node ids are sorted; when they are contiguous (always true for .gr
+        # input) a node's row is node - first_id. Otherwise this process keeps
+        # an id -> row dict.
+        num_nodes = len(self.node_ids)
+        self._first_id = None
+        self._row_of = None
+        if num_nodes and int(self.node_ids[-1]) - int(self.node_ids[0]) == num_nodes - 1:
+            self._first_id = int(self.node_ids[0])
+        else:
+            self._row_of = {int(node): row for row, node in enumerate(self.node_ids)}
+
+    # Workers receive only the directory and map the same files again, so the
+    # operating system shares one copy of the adjacency between processes.
+    def __getstate__(self):
+        return {'store_dir': self.store_dir}
+
+    def __setstate__(self, state):
+        self.__init__(state['store_dir'])
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __contains__(self, node):
+        if self._first_id is not None:
+            return self._first_id <= node < self._first_id + len(self.node_ids)
+        return node in self._row_of
+
+    def number_of_nodes(self):
+        return len(self.node_ids)
+
+    def number_of_edges(self):
+        return self.metadata['num_edges']
+
+    def nodes(self):
+        if self._first_id is not None:
+            return range(self._first_id, self._first_id + len(self.node_ids))
+        return self.node_ids
+
+    def _row(self, node):
+        if self._first_id is not None:
+            row = node - self._first_id
+            if 0 <= row < len(self.node_ids):
+                return row
+            raise KeyError(f"Node not in graph store: {node}")
+        try:
+            return self._row_of[node]
+        except KeyError:
+            raise KeyError(f"Node not in graph store: {node}") from None
+
+    def index_of(self, nodes):
+        nodes = np.asarray(nodes, dtype=np.int64)
+        indices = np.searchsorted(self.node_ids, nodes)
+        clipped = np.minimum(indices, len(self.node_ids) - 1)
+        missing = (indices >= len(self.node_ids)) | (self.node_ids[clipped] != nodes)
+        if missing.any():
+            raise KeyError(f"Nodes not in graph store: {nodes[missing][:10].tolist()}")
+        return indices
+
+    def neighbor_indices(self, index):
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def neighbors(self, node):
+        row = self._row(node)
+        neighbor_rows = self._indices[self._indptr[row]:self._indptr[row + 1]].tolist()
+        if self._first_id is not None:
+            first_id = self._first_id
+            return [neighbor + first_id for neighbor in neighbor_rows]
+        return self.node_ids[neighbor_rows].tolist()
+
+    def degree(self, node):
+        row = self._row(node)
+        return int(self._indptr[row + 1] - self._indptr[row])
+
+    def edges(self):
+        for index in range(len(self.node_ids)):
+            u = int(self.node_ids[index])
+            for neighbor in self.neighbor_indices(index):
+                if neighbor > index:
+                    yield u, int(self.node_ids[neighbor])
+
+
+def is_dominating_set(store, solution, chunk_size=CHUNK_SIZE):
+    num_nodes = store.number_of_nodes()
+    in_solution = np.zeros(num_nodes, dtype=bool)
+    in_solution[store.index_of(list(solution))] = True
+
+    for start in range(0, num_nodes, chunk_size):
+        end = min(start + chunk_size, num_nodes)
+        row_ptr = np.asarray(store.indptr[start:end + 1])
+        dominated = in_solution[start:end].copy()
+
+        has_neighbors = np.diff(row_ptr) > 0
+        if has_neighbors.any():
+            neighbor_in_solution = in_solution[store.indices[row_ptr[0]:row_ptr[-1]]]
+            offsets = (row_ptr[:-1] - row_ptr[0])[has_neighbors]
+            dominated[has_neighbors] |= np.logical_or.reduceat(neighbor_in_solution, offsets)
+
+        if not dominated.all():
+            return False
+
+    return True
+
+
+def greedy_dominating_set(store):
+    num_nodes = store.number_of_nodes()
+    cover = np.zeros(num_nodes, dtype=np.int32)
+    in_solution = np.zeros(num_nodes, dtype=bool)
+
+    def gain(index):
+        return int(cover[index] == 0) + int(np.count_nonzero(cover[store.neighbor_indices(index)] == 0))
+
+    for index in range(num_nodes):
+        if cover[index] > 0:
+            continue
+
+        candidates = [index, *store.neighbor_indices(index).tolist()]
+        best = max(candidates, key=gain)
+        cover[best] += 1
+        cover[store.neighbor_indices(best)] += 1
+        in_solution[best] = True
+
+    solution = np.flatnonzero(in_solution)
+    degrees = np.diff(store.indptr)
+    for index in solution[np.argsort(degrees[solution], kind='stable')]:
+        neighbors = store.neighbor_indices(index)
+        if cover[index] > 1 and (cover[neighbors] > 1).all():
+            cover[index] -= 1
+            cover[neighbors] -= 1
+            in_solution[index] = False
+
+    return store.node_ids[np.flatnonzero(in_solution)].tolist()
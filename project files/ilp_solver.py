@@ -1,6 +1,7 @@
-import pulp as pl
 import time
 
+from exact_solver import EXACT_MAX_NODES, connected_components, solve_component
+
 
 class DominatingSetILP:
     def __init__(self, graph):
@@ -10,33 +11,51 @@ class DominatingSetILP:
         self.runtime = None
         self.optimal_solution_found = False
 
-    def solve(self, time_limit=300):
+    def solve(self, time_limit=300, msg=True, exact_max_nodes=EXACT_MAX_NODES):
         start_time = time.time()
-        self._solve_with_pulp(time_limit)
+        self.solution = []
+        self.optimal_solution_found = True
+
+        # Small components are solved exactly in-process; CBC startup and LP
+        # file I/O would dominate their runtime.
+        remaining = set()
+        for component in connected_components(self.graph):
+            if len(component) <= exact_max_nodes:
+                component_solution, proven = solve_component(self.graph, component, start_time + time_limit)
+                if proven:
+                    self.solution.extend(component_solution)
+                    continue
+            remaining.update(component)
+
+        if remaining:
+            # Keep graph order: CBC's runtime is sensitive to the order of
+            # variables and constraints in the model.
+            remaining_nodes = [node for node in self.graph.nodes() if node in remaining]
+            self._solve_with_pulp(remaining_nodes, max(1, time_limit - (time.time() - start_time)), msg)
+
+        self.objective_value = len(self.solution)
         self.runtime = time.time() - start_time
         return self.solution
 
-    def _solve_with_pulp(self, time_limit):
+    def _solve_with_pulp(self, nodes, time_limit, msg=True):
+        import pulp as pl
+
         model = pl.LpProblem(name="dominating_set", sense=pl.LpMinimize)
 
-        x = {node: pl.LpVariable(name=f"x_{node}", cat='Binary') for node in self.graph.nodes()}
+        x = {node: pl.LpVariable(name=f"x_{node}", cat='Binary') for node in nodes}
 
-        model += pl.lpSum(x[node] for node in self.graph.nodes())
+        model += pl.lpSum(x[node] for node in nodes)
 
-        for node in self.graph.nodes():
+        for node in nodes:
             neighbors = list(self.graph.neighbors(node))
             model += (x[node] + pl.lpSum(x[neigh] for neigh in neighbors) >= 1, f"dominate_{node}")
 
-        solver = pl.PULP_CBC_CMD(timeLimit=time_limit)
+        solver = pl.PULP_CBC_CMD(timeLimit=time_limit, msg=msg)
 
         model.solve(solver)
 
         if model.status == pl.LpStatusOptimal or model.status == pl.LpStatusNotSolved:
-            self.solution = [node for node in self.graph.nodes() if pl.value(x[node]) > 0.5]
-            self.objective_value = len(self.solution)
-
-            self.optimal_solution_found = True
+            self.solution.extend(node for node in nodes if pl.value(x[node]) > 0.5)
         else:
-            self.solution = list(self.graph.nodes())
-            self.objective_value = len(self.solution)
-            self.optimal_solution_found = False
\ No newline at end of file
+            self.solution.extend(nodes)
+            self.optimal_solution_found = False
@@ -0,0 +1,73 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'pandas', 'pulp', 'numpy', 'networkx']
+
+# Modules that each entry point is allowed to pull in at import time.
+ALLOWED_IMPORTS = {
+    'sa_solver': [],
+    'ilp_solver': [],
+    'utils': ['networkx', 'numpy'],
+    'benchmark': ['networkx', 'numpy'],
+    'main': ['networkx', 'numpy'],
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module, cwd):
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], cwd=cwd, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def run_import_benchmark(modules, repeats=5, cwd=None):
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    results = []
+
+    for module in modules:
+        measurements = [measure_import(module, cwd) for _ in range(repeats)]
+        elapsed = sorted(m['elapsed'] for m in measurements)
+        loaded = measurements[0]['loaded']
+        unexpected = [m for m in loaded if m not in ALLOWED_IMPORTS[module]]
+
+        results.append({
+            'module': module,
+            'median_import_time': elapsed[len(elapsed) // 2],
+            'min_import_time': elapsed[0],
+            'heavy_modules_loaded': loaded,
+            'unexpected_modules': unexpected
+        })
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure import time of the solver modules")
+    parser.add_argument('modules', nargs='*', help=f"modules to measure (default: {', '.join(ALLOWED_IMPORTS)})")
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    unknown_modules = [m for m in args.modules if m not in ALLOWED_IMPORTS]
+    if unknown_modules:
+        parser.error(f"unknown modules: {', '.join(unknown_modules)}")
+
+    failed = False
+    for result in run_import_benchmark(args.modules or list(ALLOWED_IMPORTS), args.repeats):
+        print(f"{result['module']}: median {result['median_import_time'] * 1000:.1f}ms, "
+              f"min {result['min_import_time'] * 1000:.1f}ms, "
+              f"loaded: {', '.join(result['heavy_modules_loaded']) or 'none'}")
+        if result['unexpected_modules']:
+            print(f"FAIL: {result['module']} imports {', '.join(result['unexpected_modules'])} at startup")
+            failed = True
+
+    sys.exit(1 if failed else 0)
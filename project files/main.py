@@ -1,38 +1,247 @@
+import argparse
 import os
+import sys
 
-import pandas as pd
+from utils import load_ds_verifier_data, read_gr, read_sol, save_results_to_csv, set_random_seed, write_sol
 
-from analysis import analyze_results
-from benchmark import run_benchmark
-from utils import load_ds_verifier_data, set_random_seed, save_results_to_csv
-from visualizations import create_extended_visualizations
 
-if __name__ == "__main__":
-    set_random_seed(42)
+def open_input(path):
+    if path == '-':
+        return sys.stdin
+    return open(path, 'r')
+
+
+def read_input(path, reader):
+    f = open_input(path)
+    try:
+        return reader(f)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def load_graph(path):
+    if path != '-' and os.path.isdir(path):
+        from graph_store import GraphStore
+
+        return GraphStore(path)
+    return read_input(path, read_gr)
+
+
+def solve_command(args):
+    set_random_seed(args.seed)
+    graph = load_graph(args.input)
+
+    if args.solver == 'greedy':
+        if hasattr(graph, 'store_dir'):
+            from graph_store import greedy_dominating_set
+
+            solution = greedy_dominating_set(graph)
+        else:
+            from dynamic_solver import DynamicDominatingSet
+
+            solution = DynamicDominatingSet(graph).get_solution()
+        found = True
+    elif args.solver == 'exact':
+        from exact_solver import DominatingSetExact
+
+        solver = DominatingSetExact(graph)
+        solution = solver.solve(time_limit=args.time_limit, max_branches=None)
+        if not solver.optimal_solution_found:
+            print("WARNING: exact search hit the time limit - solution is not proven optimal", file=sys.stderr)
+        found = True
+    elif args.solver == 'ilp':
+        from ilp_solver import DominatingSetILP
+
+        solver = DominatingSetILP(graph)
+        solution = solver.solve(time_limit=args.time_limit, msg=False)
+        found = solver.optimal_solution_found
+    elif args.chains > 1:
+        from shared_graph import parallel_sa
+
+        solution, found, _ = parallel_sa(graph, chains=args.chains, workers=args.workers, seed=args.seed,
+                                         iterations_per_temp=args.sa_iterations, time_limit=args.time_limit)
+    else:
+        from sa_solver import DominatingSetSA
 
-    os.makedirs("results", exist_ok=True)
-    os.makedirs("results/analysis", exist_ok=True)
+        solver = DominatingSetSA(graph)
+        solution = solver.solve(iterations_per_temp=args.sa_iterations, time_limit=args.time_limit)
+        found = solver.optimal_solution_found
+
+    if not found:
+        print(f"WARNING: {args.solver.upper()} could not find a solution - using all nodes as fallback",
+              file=sys.stderr)
+
+    write_sol(solution, sys.stdout)
+    return 0
+
+
+def bench_command(args):
+    from benchmark import run_benchmark
+
+    set_random_seed(args.seed)
+
+    os.makedirs(args.results_dir, exist_ok=True)
 
     print("\nLoading DS Verifier data...")
-    ds_verifier_data_dir = "ds_verifier_data"
-    ds_verifier_instances = load_ds_verifier_data(ds_verifier_data_dir)
+    ds_verifier_instances = load_ds_verifier_data(args.data_dir)
+
+    if args.instances:
+        ds_verifier_instances = [instance for instance in ds_verifier_instances
+                                 if any(pattern in instance[1] for pattern in args.instances)]
+    if args.max_nodes is not None:
+        ds_verifier_instances = [instance for instance in ds_verifier_instances
+                                 if len(instance[0].nodes()) <= args.max_nodes]
     print(f"Total instances for benchmark: {len(ds_verifier_instances)}")
 
     print("\nRunning benchmarks...")
     results = run_benchmark(
         ds_verifier_instances,
-        ilp_time_limit=60,
-        sa_time_limit=60,
-        sa_iterations=100
+        ilp_time_limit=args.ilp_time_limit,
+        sa_time_limit=args.sa_time_limit,
+        sa_iterations=args.sa_iterations,
+        solvers=args.solvers,
+        plot=args.plot,
+        workers=args.workers,
+        results_dir=args.results_dir
     )
 
     print("\nSaving results...")
-    save_results_to_csv(results, "results/dominating_set_results.csv")
+    results_file = os.path.join(args.results_dir, "dominating_set_results.csv")
+    save_results_to_csv(results, results_file)
+
+    if args.plot or args.analyze:
+        import pandas as pd
+
+        df = pd.DataFrame(results)
+        both_solvers = 'ilp' in args.solvers and 'sa' in args.solvers
+
+        if args.plot and both_solvers:
+            from visualizations import create_extended_visualizations
+
+            create_extended_visualizations(df, args.results_dir)
+
+        if args.analyze:
+            from analysis import analyze_results
+
+            print("\nPerforming enhanced analysis...")
+            analyze_results(df, os.path.join(args.results_dir, "analysis"))
+
+    print("\nBenchmark complete")
+    return 0
 
-    df = pd.DataFrame(results)
-    create_extended_visualizations(df)
+
+def verify_command(args):
+    from sa_solver import DominatingSetSA
+
+    graph = load_graph(args.graph)
+    solution_size, solution = read_input(args.solution, read_sol)
+
+    unknown_nodes = [node for node in solution if node not in graph]
+    if solution_size != len(solution):
+        print(f"Invalid: declared size {solution_size} but {len(solution)} nodes listed")
+        return 1
+    if unknown_nodes:
+        print(f"Invalid: nodes not in graph: {unknown_nodes}")
+        return 1
+    if hasattr(graph, 'store_dir'):
+        from graph_store import is_dominating_set
+
+        is_valid = is_dominating_set(graph, solution)
+    else:
+        is_valid = DominatingSetSA(graph).is_dominating_set(solution)
+
+    if not is_valid:
+        print("Invalid: solution is not a dominating set")
+        return 1
+
+    print(f"Valid: dominating set of size {len(solution)}")
+    return 0
+
+
+def convert_command(args):
+    from graph_store import convert_gr_to_store
+
+    store = convert_gr_to_store(args.input, args.output)
+    print(f"Wrote {store.number_of_nodes()} nodes and {store.number_of_edges()} edges to {args.output}")
+    return 0
+
+
+def analyze_command(args):
+    import pandas as pd
+
+    from analysis import analyze_results
+    from visualizations import create_extended_visualizations
+
+    df = pd.read_csv(args.results)
+
+    if args.plot:
+        if 'ilp_valid' in df.columns and 'sa_valid' in df.columns:
+            create_extended_visualizations(df, os.path.dirname(args.results) or ".")
+        else:
+            print("Results do not contain both ILP and SA runs. Skipping comparison plots.")
 
     print("\nPerforming enhanced analysis...")
-    analyze_results(df)
+    analyze_results(df, args.output_dir)
 
-    print("\nAnalysis complete")
\ No newline at end of file
+    print("\nAnalysis complete")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Minimum dominating set solvers and benchmarks")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    solve_parser = subparsers.add_parser('solve', help="solve a single .gr instance and write a .sol to stdout")
+    solve_parser.add_argument('input', nargs='?', default='-',
+                              help=".gr file or graph store directory to solve ('-' reads stdin)")
+    solve_parser.add_argument('--solver', choices=['sa', 'ilp', 'exact', 'greedy'], default='sa')
+    solve_parser.add_argument('--time-limit', type=float, default=60)
+    solve_parser.add_argument('--sa-iterations', type=int, default=100)
+    solve_parser.add_argument('--chains', type=int, default=1, help="independent SA chains to run in parallel")
+    solve_parser.add_argument('--workers', type=int, help="worker processes for --chains (default: one per chain)")
+    solve_parser.add_argument('--seed', type=int, default=42)
+    solve_parser.set_defaults(func=solve_command)
+
+    bench_parser = subparsers.add_parser('bench', help="run the solvers on a directory of .gr/.sol instances")
+    bench_parser.add_argument('--data-dir', default="ds_verifier_data")
+    bench_parser.add_argument('--results-dir', default="results")
+    bench_parser.add_argument('--solvers', nargs='+', choices=['ilp', 'sa'], default=['ilp', 'sa'])
+    bench_parser.add_argument('--ilp-time-limit', type=float, default=60)
+    bench_parser.add_argument('--sa-time-limit', type=float, default=60)
+    bench_parser.add_argument('--sa-iterations', type=int, default=100)
+    bench_parser.add_argument('--workers', type=int, default=1)
+    bench_parser.add_argument('--instances', nargs='+', metavar='PATTERN',
+                              help="only run instances whose name contains one of the patterns")
+    bench_parser.add_argument('--max-nodes', type=int, help="skip instances with more nodes than this")
+    bench_parser.add_argument('--plot', action='store_true', help="draw solution and comparison plots")
+    bench_parser.add_argument('--analyze', action='store_true', help="run the statistical analysis afterwards")
+    bench_parser.add_argument('--seed', type=int, default=42)
+    bench_parser.set_defaults(func=bench_command)
+
+    verify_parser = subparsers.add_parser('verify', help="check a .sol against a .gr instance")
+    verify_parser.add_argument('graph', help=".gr file or graph store directory ('-' reads stdin)")
+    verify_parser.add_argument('solution', help=".sol file ('-' reads stdin)")
+    verify_parser.set_defaults(func=verify_command)
+
+    convert_parser = subparsers.add_parser('convert', help="convert a .gr file to a memory-mapped graph store")
+    convert_parser.add_argument('input', help=".gr file to convert")
+    convert_parser.add_argument('output', help="graph store directory to write")
+    convert_parser.set_defaults(func=convert_command)
+
+    analyze_parser = subparsers.add_parser('analyze', help="analyze a saved benchmark results CSV")
+    analyze_parser.add_argument('--results', default="results/dominating_set_results.csv")
+    analyze_parser.add_argument('--output-dir', default="results/analysis")
+    analyze_parser.add_argument('--plot', action='store_true', help="also redraw the comparison plots")
+    analyze_parser.set_defaults(func=analyze_command)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
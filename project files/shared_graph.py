@@ -0,0 +1,90 @@
+import os
+import random
+import shutil
+import tempfile
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from graph_store import GraphStore, write_graph_to_store
+
+# Graphs opened by this process, keyed by store directory. Pool workers keep
+# their mapping across tasks instead of reopening it per task, and drop it once
+# the publisher has removed the store so the mapped pages can be freed.
+_attached_graphs = {}
+
+
+def release_attached_graphs(only_removed=False):
+    for store_dir in list(_attached_graphs):
+        if not only_removed or not os.path.isdir(store_dir):
+            del _attached_graphs[store_dir]
+
+
+def _default_base_dir():
+    return "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+class SharedGraphHandle:
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+
+    def open(self):
+        release_attached_graphs(only_removed=True)
+        graph = _attached_graphs.get(self.store_dir)
+        if graph is None:
+            graph = GraphStore(self.store_dir)
+            _attached_graphs[self.store_dir] = graph
+        return graph
+
+    def close(self):
+        _attached_graphs.pop(self.store_dir, None)
+
+
+class SharedGraph:
+    def __init__(self, graph, base_dir=None):
+        if isinstance(graph, GraphStore):
+            self.store_dir = graph.store_dir
+            self.owns_store = False
+        else:
+            self.store_dir = tempfile.mkdtemp(prefix="dominating_set_", dir=base_dir or _default_base_dir())
+            self.owns_store = True
+            write_graph_to_store(graph, self.store_dir, source="shared")
+
+        self.handle = SharedGraphHandle(self.store_dir)
+        self._finalizer = weakref.finalize(self, _remove_store, self.store_dir, self.owns_store)
+
+    def close(self):
+        self.handle.close()
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _remove_store(store_dir, owns_store):
+    _attached_graphs.pop(store_dir, None)
+    if owns_store:
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+
+def _run_sa_chain(handle, seed, solve_options):
+    from sa_solver import DominatingSetSA
+
+    random.seed(seed)
+    solver = DominatingSetSA(handle.open())
+    solution = [int(node) for node in solver.solve(**solve_options)]
+    return solution, solver.runtime, solver.optimal_solution_found
+
+
+def parallel_sa(graph, chains=4, workers=None, seed=42, **solve_options):
+    with SharedGraph(graph) as shared:
+        with ProcessPoolExecutor(max_workers=workers or chains) as executor:
+            futures = [executor.submit(_run_sa_chain, shared.handle, seed + chain, solve_options)
+                       for chain in range(chains)]
+            results = [future.result() for future in futures]
+
+    found = [result for result in results if result[2]]
+    best_solution, _, _ = min(found or results, key=lambda result: len(result[0]))
+    return best_solution, bool(found), [result[1] for result in results]
@@ -2,13 +2,64 @@ import csv
 import glob
 import os
 import random
+import sys
 import networkx as nx
-import numpy as np
 
 
 def set_random_seed(seed=42):
     random.seed(seed)
-    np.random.seed(seed)
+
+    if 'numpy' in sys.modules:
+        sys.modules['numpy'].random.seed(seed)
+
+def read_gr(lines):
+    G = nx.Graph()
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('c'):
+            continue
+
+        parts = line.split()
+        if parts[0] == 'p':
+            if len(parts) >= 3 and parts[1] == 'ds':
+                G.add_nodes_from(range(1, int(parts[2]) + 1))
+            continue
+
+        if len(parts) >= 2:
+            u, v = int(parts[0]), int(parts[1])
+            G.add_edge(u, v)
+
+    return G
+
+
+def read_sol(lines):
+    solution_size = None
+    solution = []
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('c'):
+            continue
+
+        try:
+            value = int(line.split()[0])
+        except ValueError:
+            continue
+
+        if solution_size is None:
+            solution_size = value
+        else:
+            solution.append(value)
+
+    return solution_size, solution
+
+
+def write_sol(solution, out):
+    out.write(f"{len(solution)}\n")
+    for node in sorted(solution):
+        out.write(f"{node}\n")
+
 
 def load_ds_verifier_data(data_dir):
 
@@ -24,24 +75,8 @@ def load_ds_verifier_data(data_dir):
             sol_file = os.path.join(data_dir, f"{instance_name}.sol")
 
             if os.path.exists(sol_file):
-                G = nx.Graph()
-
                 with open(gr_file, 'r') as f:
-                    lines = f.readlines()
-
-                    header = lines[0].strip().split()
-                    if len(header) >= 3 and header[0] == 'p' and header[1] == 'ds':
-                        num_nodes = int(header[2])
-
-                        G.add_nodes_from(range(1, num_nodes + 1))
-
-                        for line in lines[1:]:
-                            line = line.strip()
-                            if line and not line.startswith('c'):
-                                edge = line.split()
-                                if len(edge) >= 2:
-                                    u, v = int(edge[0]), int(edge[1])
-                                    G.add_edge(u, v)
+                    G = read_gr(f)
 
                 known_solution = []
                 with open(sol_file, 'r') as f:
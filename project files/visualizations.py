@@ -1,9 +1,7 @@
 import math
-import math
 import os
 import networkx as nx
 import numpy as np
-import seaborn as sns
 from matplotlib import pyplot as plt
 
 
@@ -61,10 +59,10 @@ def visualize_graph_with_solution(graph, solution, title, filename=None, optimal
     else:
         plt.show()
 
-def create_extended_visualizations(df):
+def create_extended_visualizations(df, output_dir="results"):
 
 
-    os.makedirs("results", exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
     if 'known_solution_size' in df.columns:
         plt.figure(figsize=(14, 8))
@@ -123,7 +121,7 @@ def create_extended_visualizations(df):
                        ha='right')
             plt.legend()
             plt.tight_layout()
-            plt.savefig("results/solution_quality_with_known.png")
+            plt.savefig(os.path.join(output_dir, "solution_quality_with_known.png"))
             plt.close()
 
         plt.figure(figsize=(12, 6))
@@ -153,7 +151,7 @@ def create_extended_visualizations(df):
             plt.xticks(x, gap_df['instance_short'], rotation=45, ha='right')
             plt.legend()
             plt.tight_layout()
-            plt.savefig("results/solution_gap_to_known.png")
+            plt.savefig(os.path.join(output_dir, "solution_gap_to_known.png"))
             plt.close()
 
 
@@ -169,5 +167,5 @@ def create_extended_visualizations(df):
     plt.title('Solution Size vs. Problem Size')
     plt.legend()
     plt.tight_layout()
-    plt.savefig("results/solution_size_vs_nodes.png")
+    plt.savefig(os.path.join(output_dir, "solution_size_vs_nodes.png"))
     plt.close()